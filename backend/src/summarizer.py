@@ -9,21 +9,21 @@ Provides extractive summarization with sentence-weight attribution using:
 """
 
 import re
+import threading
 import warnings
+from collections import OrderedDict
 from typing import List, Tuple, Dict, Optional
 import numpy as np
 
 # Optional imports with graceful fallback
 try:
-    import networkx as nx
-    HAS_NETWORKX = True
+    from scipy import sparse
+    HAS_SCIPY = True
 except ImportError:
-    HAS_NETWORKX = False
-    warnings.warn("networkx not installed. TextRank will be disabled. Install with: pip install networkx")
+    HAS_SCIPY = False
 
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
     HAS_SKLEARN = True
 except ImportError:
     HAS_SKLEARN = False
@@ -35,6 +35,12 @@ try:
 except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 try:
     import nltk
     from nltk.tokenize import word_tokenize
@@ -51,6 +57,261 @@ except ImportError:
     warnings.warn("nltk not installed. Basic tokenization will be used. Install with: pip install nltk")
 
 
+# Lookup table for popcount on NumPy versions without np.bitwise_count (< 2.0)
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(x: np.ndarray) -> np.ndarray:
+    """Count set bits per element of a uint64 array."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x)
+    return _POPCOUNT_TABLE[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1)
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _popcount64(x):
+        """Count set bits in a uint64 (SWAR), returned as int64 so sums stay integer."""
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return np.int64((x * np.uint64(0x0101010101010101)) >> np.uint64(56))
+
+    @njit(parallel=True, cache=True)
+    def _pairwise_jaccard(bitsets, sizes, out):
+        """Fill out[i, j] with the Jaccard similarity of bitset rows i and j, parallel over i."""
+        n, n_words = bitsets.shape
+        for i in prange(n):
+            if sizes[i] > 0:
+                out[i, i] = 1.0
+            for j in range(i + 1, n):
+                inter = np.int64(0)
+                for k in range(n_words):
+                    inter += _popcount64(bitsets[i, k] & bitsets[j, k])
+                union = sizes[i] + sizes[j] - inter
+                if union > 0:
+                    sim = inter / union
+                    out[i, j] = sim
+                    out[j, i] = sim
+
+    @njit(parallel=True, cache=True)
+    def _jaccard_rows(bitsets, sizes, start, out):
+        """Fill out[r, j] with the Jaccard similarity of bitset rows start + r and j."""
+        n, n_words = bitsets.shape
+        for r in prange(out.shape[0]):
+            i = start + r
+            for j in range(n):
+                inter = np.int64(0)
+                for k in range(n_words):
+                    inter += _popcount64(bitsets[i, k] & bitsets[j, k])
+                union = sizes[i] + sizes[j] - inter
+                if union > 0:
+                    out[r, j] = inter / union
+
+    @njit(fastmath=True, cache=True)
+    def _pagerank_kernel(transition, dangling, damping, max_iter, tol):
+        """Power iteration on a row-stochastic matrix, reusing two rank buffers."""
+        n = transition.shape[0]
+        ranks = np.full(n, 1.0 / n)
+        new_ranks = np.empty(n)
+        base = (1.0 - damping) / n
+        for _ in range(max_iter):
+            dangling_mass = 0.0
+            for i in range(n):
+                if dangling[i]:
+                    dangling_mass += ranks[i]
+            new_ranks[:] = base + damping * dangling_mass / n
+            for i in range(n):
+                weight = damping * ranks[i]
+                for j in range(n):
+                    new_ranks[j] += transition[i, j] * weight
+            diff = 0.0
+            for k in range(n):
+                diff += abs(new_ranks[k] - ranks[k])
+            ranks, new_ranks = new_ranks, ranks
+            if diff < n * tol:
+                break
+        return ranks
+
+
+def _build_token_bitsets(sentence_tokens: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode each sentence's token set as a row of packed uint64 bits.
+    
+    Tokens are interned to int32 ids over the document vocabulary, and bits are
+    set for all sentences in a single scatter.
+    
+    Returns:
+        Tuple of (bitsets, set_sizes)
+        - bitsets: Array of shape (N, ceil(V / 64)) where V is the vocabulary size
+        - set_sizes: Number of distinct tokens per sentence
+    """
+    vocab = {tok: i for i, tok in enumerate(set().union(*sentence_tokens))}
+    token_ids = [
+        np.unique(np.fromiter((vocab[t] for t in tokens), dtype=np.int32, count=len(tokens)))
+        for tokens in sentence_tokens
+    ]
+    set_sizes = np.array([len(ids) for ids in token_ids], dtype=np.int64)
+    
+    n_words = max(1, (len(vocab) + 63) >> 6)
+    bitsets = np.zeros((len(sentence_tokens), n_words), dtype=np.uint64)
+    if set_sizes.sum() > 0:
+        rows = np.repeat(np.arange(len(sentence_tokens)), set_sizes)
+        cols = np.concatenate(token_ids)
+        bits = np.left_shift(np.uint64(1), (cols & 63).astype(np.uint64))
+        np.bitwise_or.at(bitsets, (rows, cols >> 6), bits)
+    return bitsets, set_sizes
+
+
+def _iter_jaccard_blocks(bitsets: np.ndarray, sizes: np.ndarray, max_elements: int = 1 << 22):
+    """
+    Yield (start, similarity_rows) blocks of the pairwise Jaccard matrix.
+    
+    Uses the parallel Numba kernel when available. Otherwise block height is
+    chosen so the (block, N, words) popcount intermediate stays under max_elements.
+    """
+    n, n_words = bitsets.shape
+    if HAS_NUMBA:
+        block_size = max(1, max_elements // max(1, n))
+        for start in range(0, n, block_size):
+            out = np.zeros((min(block_size, n - start), n), dtype=np.float32)
+            _jaccard_rows(bitsets, sizes, start, out)
+            yield start, out
+        return
+    
+    block_size = max(1, max_elements // max(1, n * n_words))
+    for start in range(0, n, block_size):
+        block = bitsets[start:start + block_size]
+        intersection = _popcount(block[:, None, :] & bitsets[None, :, :]).sum(axis=-1, dtype=np.int64)
+        union = sizes[start:start + block_size, None] + sizes[None, :] - intersection
+        yield start, np.divide(
+            intersection, union,
+            out=np.zeros(intersection.shape, dtype=np.float32),
+            where=union > 0
+        )
+
+
+def _jaccard_similarity_matrix(sentence_tokens: List[List[str]]) -> np.ndarray:
+    """
+    Compute pairwise Jaccard similarity between token sets using bitset popcounts.
+    
+    Uses a parallel Numba kernel when available; otherwise rows are broadcast in
+    memory-bounded blocks.
+    
+    Returns:
+        Symmetric (N, N) similarity matrix (diagonal is 1 for non-empty sentences)
+    """
+    bitsets, sizes = _build_token_bitsets(sentence_tokens)
+    n = bitsets.shape[0]
+    similarity = np.zeros((n, n), dtype=np.float32)
+    
+    if HAS_NUMBA:
+        _pairwise_jaccard(bitsets, sizes, similarity)
+        return similarity
+    
+    for start, rows in _iter_jaccard_blocks(bitsets, sizes):
+        similarity[start:start + rows.shape[0]] = rows
+    return similarity
+
+
+def _knn_jaccard_adjacency(sentence_tokens: List[List[str]], k: int, threshold: float = 0.1):
+    """
+    Build a sparse similarity graph keeping each sentence's k most similar neighbours.
+    
+    The full N x N matrix is never materialized; edges are symmetrized so the
+    graph stays undirected.
+    
+    Returns:
+        scipy.sparse CSR adjacency of shape (N, N) with edges above threshold
+    """
+    bitsets, sizes = _build_token_bitsets(sentence_tokens)
+    n = bitsets.shape[0]
+    k = min(k, n - 1)
+    
+    rows, cols, vals = [], [], []
+    for start, block in _iter_jaccard_blocks(bitsets, sizes):
+        local = np.arange(block.shape[0])
+        block[local, start + local] = 0.0
+        neighbours = np.argpartition(block, -k, axis=1)[:, -k:]
+        weights = np.take_along_axis(block, neighbours, axis=1)
+        keep = weights > threshold
+        rows.append(np.broadcast_to((start + local)[:, None], neighbours.shape)[keep])
+        cols.append(neighbours[keep])
+        vals.append(weights[keep])
+    
+    adjacency = sparse.csr_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n, n)
+    )
+    return adjacency.maximum(adjacency.T).tocsr()
+
+
+def _pagerank(
+    adjacency: np.ndarray,
+    damping: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1e-6
+) -> np.ndarray:
+    """
+    Weighted PageRank by power iteration on a dense or scipy.sparse adjacency matrix.
+    
+    Rank held by dangling nodes (no edges) is spread uniformly, matching
+    networkx.pagerank. Dense inputs use the Numba kernel when available.
+    
+    Returns:
+        Array of PageRank scores (normalized to sum to 1)
+    """
+    n = adjacency.shape[0]
+    out_weight = np.asarray(adjacency.sum(axis=1), dtype=np.float32).ravel()
+    dangling = out_weight == 0
+    inv_weight = 1.0 / np.where(dangling, np.float32(1.0), out_weight)
+    if HAS_SCIPY and sparse.issparse(adjacency):
+        transition_t = (sparse.diags(inv_weight) @ adjacency).T.tocsr()
+    else:
+        transition = adjacency * inv_weight[:, None]
+        if HAS_NUMBA:
+            ranks = _pagerank_kernel(transition, dangling, damping, max_iter, tol).astype(np.float32)
+            return ranks / ranks.sum()
+        transition_t = transition.T
+    
+    ranks = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(max_iter):
+        new_ranks = damping * (transition_t @ ranks + ranks[dangling].sum() / n) + (1.0 - damping) / n
+        converged = np.abs(new_ranks - ranks).sum() < n * tol
+        ranks = new_ranks
+        if converged:
+            break
+    
+    return ranks / ranks.sum()
+
+
+def _centroid_similarities(vectors) -> np.ndarray:
+    """
+    Cosine similarity between each row of a dense or sparse matrix and its centroid.
+    
+    Returns:
+        Array of similarities, one per row (0 for all-zero rows)
+    """
+    n = vectors.shape[0]
+    centroid = np.asarray(vectors.sum(axis=0), dtype=np.float32).ravel() / n
+    centroid_norm = np.linalg.norm(centroid) + 1e-12
+    if HAS_SCIPY and sparse.issparse(vectors):
+        # Row norms straight from the CSR data, without a squared copy of the matrix
+        vectors = vectors.tocsr()
+        row_ids = np.repeat(np.arange(n), np.diff(vectors.indptr))
+        row_norms = np.sqrt(np.bincount(row_ids, weights=vectors.data ** 2, minlength=n))
+    else:
+        row_norms = np.linalg.norm(vectors, axis=1)
+    dots = np.asarray(vectors @ centroid, dtype=np.float32).ravel()
+    return dots / ((row_norms.astype(np.float32) + 1e-12) * centroid_norm)
+
+
+# Loaded sentence-transformers models, keyed by model name; loads are
+# serialized so concurrent first requests share a single copy
+_ST_CACHE: Dict[str, 'SentenceTransformer'] = {}
+_ST_CACHE_LOCK = threading.Lock()
+
+
 class SentenceSummarizer:
     """
     Extractive summarizer that assigns weights to sentences and selects top-k.
@@ -63,7 +324,9 @@ class SentenceSummarizer:
         tfidf_weight: float = 0.30,
         position_weight: float = 0.10,
         use_embeddings: bool = False,
-        embedding_model_name: str = 'all-MiniLM-L6-v2'
+        embedding_model_name: str = 'all-MiniLM-L6-v2',
+        use_nltk_tokenizer: bool = False,
+        encode_batch_size: int = 64
     ):
         """
         Initialize the summarizer with component weights.
@@ -75,6 +338,8 @@ class SentenceSummarizer:
             position_weight: Weight for position-based score (0-1)
             use_embeddings: If True, use sentence-transformers for better similarity
             embedding_model_name: Model name for sentence-transformers
+            use_nltk_tokenizer: If True, tokenize with NLTK word_tokenize instead of the regex tokenizer
+            encode_batch_size: Batch size for sentence-transformers encoding
         """
         self.cnn_prob_weight = cnn_prob_weight
         self.textrank_weight = textrank_weight
@@ -90,32 +355,83 @@ class SentenceSummarizer:
             self.tfidf_weight /= total
             self.position_weight /= total
         
+        # Embedding model is loaded on first use and shared across instances
         self.use_embeddings = use_embeddings and HAS_SENTENCE_TRANSFORMERS
-        if self.use_embeddings:
+        self._emb_model_name = embedding_model_name
+        self._embedding_model = None
+        self.encode_batch_size = encode_batch_size
+        
+        # Tokenization resources, built once per instance
+        self.use_nltk_tokenizer = use_nltk_tokenizer and HAS_NLTK
+        self._stop_words = frozenset()
+        if HAS_NLTK:
             try:
-                self.embedding_model = SentenceTransformer(embedding_model_name)
+                self._stop_words = frozenset(stopwords.words('english'))
+            except LookupError:
+                warnings.warn("NLTK stopwords corpus unavailable. Stopwords will not be removed.")
+        self._token_re = re.compile(r'\b\w+\b')
+        
+        # TextRank graph limits: uniform scores below min_n sentences, and a
+        # sparse k-nearest-neighbour graph above dense_max_n sentences
+        self._textrank_min_n = 5
+        self._textrank_dense_max_n = 2000
+        self._textrank_knn = 20
+        
+        # TF-IDF configuration; float32 output halves the sparse matrix size
+        self._tfidf_kwargs = dict(max_features=5000, ngram_range=(1, 2), dtype=np.float32)
+        
+        # Position decay table, grown to the longest document seen
+        self._position_cache = np.empty(0, dtype=np.float32)
+        
+        # LRU cache of computed weights (see _weight_cache_key); the instance may
+        # be shared across request threads, so access goes through the lock
+        self._weight_cache: 'OrderedDict[tuple, Tuple[np.ndarray, Dict[str, np.ndarray]]]' = OrderedDict()
+        self._weight_cache_size = 32
+        self._weight_cache_lock = threading.Lock()
+    
+    @property
+    def embedding_model(self) -> Optional['SentenceTransformer']:
+        """Sentence-transformers model, loaded lazily from the module-level cache."""
+        if self._embedding_model is None and self.use_embeddings:
+            try:
+                model = _ST_CACHE.get(self._emb_model_name)
+                if model is None:
+                    with _ST_CACHE_LOCK:
+                        model = _ST_CACHE.get(self._emb_model_name)
+                        if model is None:
+                            model = SentenceTransformer(self._emb_model_name)
+                            if str(model.device).startswith('cuda'):
+                                model = model.half()
+                            _ST_CACHE[self._emb_model_name] = model
+                self._embedding_model = model
             except Exception as e:
                 warnings.warn(f"Failed to load sentence-transformers model: {e}. Falling back to TF-IDF.")
                 self.use_embeddings = False
-                self.embedding_model = None
-        else:
-            self.embedding_model = None
+        return self._embedding_model
     
     def _tokenize_sentence(self, sentence: str) -> List[str]:
-        """Tokenize a sentence into words."""
-        if HAS_NLTK:
+        """Tokenize a sentence into words, removing stopwords and punctuation."""
+        if self.use_nltk_tokenizer:
             try:
                 tokens = word_tokenize(sentence.lower())
-                # Remove stopwords and punctuation
-                stop_words = set(stopwords.words('english'))
-                tokens = [t for t in tokens if t.isalnum() and t not in stop_words]
-                return tokens
+                return [t for t in tokens if t.isalnum() and t not in self._stop_words]
             except Exception:
                 pass
         
-        # Fallback: simple tokenization
-        tokens = re.findall(r'\b\w+\b', sentence.lower())
-        return tokens
+        return [t for t in self._token_re.findall(sentence.lower()) if t not in self._stop_words]
+    
+    def _tokenize_batch(self, sentences: List[str]) -> List[List[str]]:
+        """Tokenize all sentences in one pass with the compiled regex."""
+        if self.use_nltk_tokenizer:
+            return [self._tokenize_sentence(s) for s in sentences]
+        
+        findall = self._token_re.findall
+        stop_words = self._stop_words
+        return [[t for t in findall(s.lower()) if t not in stop_words] for s in sentences]
+    
+    def _fresh_vectorizer(self) -> 'TfidfVectorizer':
+        """Create an unfitted TF-IDF vectorizer with the instance configuration."""
+        return TfidfVectorizer(**self._tfidf_kwargs)
     
     def _compute_textrank_scores(self, sentences: List[str]) -> np.ndarray:
         """
@@ -124,53 +440,27 @@ class SentenceSummarizer:
         Returns:
             Array of TextRank scores (normalized to sum to 1)
         """
-        if not HAS_NETWORKX:
-            # Fallback: return uniform scores
-            return np.ones(len(sentences)) / len(sentences)
-        
-        if len(sentences) < 2:
-            return np.ones(len(sentences)) / len(sentences) if len(sentences) > 0 else np.array([])
-        
-        # Build similarity graph
-        G = nx.Graph()
-        G.add_nodes_from(range(len(sentences)))
+        n = len(sentences)
+        if n < self._textrank_min_n:
+            # Too few sentences for a meaningful graph
+            return np.ones(n, dtype=np.float32) / n if n > 0 else np.array([], dtype=np.float32)
         
         # Tokenize sentences
-        sentence_tokens = [self._tokenize_sentence(s) for s in sentences]
-        
-        # Compute similarity between sentence pairs
-        for i in range(len(sentences)):
-            for j in range(i + 1, len(sentences)):
-                tokens_i = set(sentence_tokens[i])
-                tokens_j = set(sentence_tokens[j])
-                
-                if len(tokens_i) == 0 or len(tokens_j) == 0:
-                    continue
-                
-                # Jaccard similarity
-                intersection = len(tokens_i & tokens_j)
-                union = len(tokens_i | tokens_j)
-                similarity = intersection / union if union > 0 else 0.0
-                
-                # Add edge if similarity > threshold
-                if similarity > 0.1:
-                    G.add_edge(i, j, weight=similarity)
-        
-        # Compute PageRank (TextRank)
-        try:
-            pagerank_scores = nx.pagerank(G, max_iter=100)
-            scores = np.array([pagerank_scores.get(i, 0.0) for i in range(len(sentences))])
-        except Exception:
-            # Fallback: uniform scores
-            scores = np.ones(len(sentences)) / len(sentences)
+        sentence_tokens = self._tokenize_batch(sentences)
         
-        # Normalize
-        if scores.sum() > 0:
-            scores = scores / scores.sum()
+        if n > self._textrank_dense_max_n and HAS_SCIPY:
+            # Bound edges to O(N * k) for large documents
+            adjacency = _knn_jaccard_adjacency(sentence_tokens, self._textrank_knn)
         else:
-            scores = np.ones(len(sentences)) / len(sentences)
+            # Pairwise Jaccard similarity over token bitsets
+            similarity = _jaccard_similarity_matrix(sentence_tokens)
+            
+            # Keep edges above threshold, no self-loops
+            adjacency = np.where(similarity > 0.1, similarity, np.float32(0.0))
+            np.fill_diagonal(adjacency, 0.0)
         
-        return scores
+        # Compute PageRank (TextRank)
+        return _pagerank(adjacency)
     
     def _compute_tfidf_scores(self, sentences: List[str]) -> np.ndarray:
         """
@@ -181,37 +471,54 @@ class SentenceSummarizer:
         """
         if not HAS_SKLEARN:
             # Fallback: return uniform scores
-            return np.ones(len(sentences)) / len(sentences)
+            return np.ones(len(sentences), dtype=np.float32) / len(sentences)
         
         if len(sentences) == 0:
-            return np.array([])
+            return np.array([], dtype=np.float32)
         
         try:
             # Compute TF-IDF vectors
-            vectorizer = TfidfVectorizer(max_features=5000, ngram_range=(1, 2))
-            tfidf_matrix = vectorizer.fit_transform(sentences)
+            tfidf_matrix = self._fresh_vectorizer().fit_transform(sentences)
             
-            # Compute document centroid
-            centroid = np.asarray(tfidf_matrix.mean(axis=0))
-            
-            # Compute cosine similarity between each sentence and centroid
-            similarities = cosine_similarity(tfidf_matrix, centroid).flatten()
+            # Compute cosine similarity between each sentence and the document centroid
+            similarities = _centroid_similarities(tfidf_matrix)
             
             # Normalize to sum to 1
             if similarities.sum() > 0:
                 similarities = similarities / similarities.sum()
             else:
-                similarities = np.ones(len(sentences)) / len(sentences)
+                similarities = np.ones(len(sentences), dtype=np.float32) / len(sentences)
             
             return similarities
         except Exception as e:
             warnings.warn(f"TF-IDF computation failed: {e}. Using uniform scores.")
-            return np.ones(len(sentences)) / len(sentences)
+            return np.ones(len(sentences), dtype=np.float32) / len(sentences)
     
-    def _compute_embedding_scores(self, sentences: List[str]) -> np.ndarray:
+    def _encode(self, sentences: List[str]) -> np.ndarray:
+        """Encode sentences into unit-length float32 embeddings."""
+        return np.asarray(
+            self.embedding_model.encode(
+                sentences,
+                batch_size=self.encode_batch_size,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            ),
+            dtype=np.float32
+        )
+    
+    def _compute_embedding_scores(
+        self,
+        sentences: List[str],
+        embeddings: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Compute sentence embedding similarity scores using sentence-transformers.
         
+        Args:
+            sentences: List of segmented sentences
+            embeddings: Optional precomputed unit-length embeddings, one row per sentence
+        
         Returns:
             Array of embedding similarity scores (normalized to sum to 1)
         """
@@ -219,20 +526,20 @@ class SentenceSummarizer:
             return self._compute_tfidf_scores(sentences)  # Fallback to TF-IDF
         
         try:
-            # Compute sentence embeddings
-            embeddings = self.embedding_model.encode(sentences, show_progress_bar=False)
-            
-            # Compute document centroid
-            centroid = embeddings.mean(axis=0, keepdims=True)
+            # Compute unit-length sentence embeddings
+            if embeddings is None:
+                embeddings = self._encode(sentences)
             
-            # Compute cosine similarity
-            similarities = cosine_similarity(embeddings, centroid).flatten()
+            # Rows are unit vectors, so cosine similarity is a dot product with the unit centroid
+            centroid = embeddings.mean(axis=0)
+            centroid /= np.linalg.norm(centroid) + 1e-12
+            similarities = embeddings @ centroid
             
             # Normalize to sum to 1
             if similarities.sum() > 0:
                 similarities = similarities / similarities.sum()
             else:
-                similarities = np.ones(len(sentences)) / len(sentences)
+                similarities = np.ones(len(sentences), dtype=np.float32) / len(sentences)
             
             return similarities
         except Exception as e:
@@ -247,17 +554,19 @@ class SentenceSummarizer:
             Array of position scores (normalized to sum to 1)
         """
         if len(sentences) == 0:
-            return np.array([])
+            return np.array([], dtype=np.float32)
         
         n = len(sentences)
         # Exponential decay: first sentence gets highest score
-        position_scores = np.exp(-np.arange(n) * 0.1)
+        # Read the shared table once; another thread may replace it concurrently
+        table = self._position_cache
+        if n > table.size:
+            table = np.exp(-np.arange(n, dtype=np.float32) * np.float32(0.1))
+            self._position_cache = table
+        position_scores = table[:n].copy()
         
         # Normalize to sum to 1
-        if position_scores.sum() > 0:
-            position_scores = position_scores / position_scores.sum()
-        else:
-            position_scores = np.ones(n) / n
+        position_scores /= position_scores.sum()
         
         return position_scores
     
@@ -280,36 +589,78 @@ class SentenceSummarizer:
         """
         if cnn_probs is None or len(cnn_probs) == 0:
             # No CNN probabilities available, return uniform scores
-            return np.ones(len(sentences)) / len(sentences) if len(sentences) > 0 else np.array([])
-        
-        # Map CNN probabilities to sentences
-        # If we have probabilities for boundaries, assign to the sentence that ends at that boundary
-        scores = np.ones(len(sentences))
-        
-        # If cnn_probs has one value per sentence, use directly
-        if len(cnn_probs) == len(sentences):
-            scores = np.array(cnn_probs)
-        elif len(cnn_probs) > len(sentences):
-            # More probabilities than sentences - average or take max
-            # Simple approach: take the first len(sentences) probabilities
-            scores = np.array(cnn_probs[:len(sentences)])
-        else:
-            # Fewer probabilities - pad with 0.5 (neutral)
-            scores = np.array(cnn_probs + [0.5] * (len(sentences) - len(cnn_probs)))
+            return np.ones(len(sentences), dtype=np.float32) / len(sentences) if len(sentences) > 0 else np.array([], dtype=np.float32)
+        
+        # One probability per sentence: extra values are dropped, missing ones
+        # are padded with 0.5 (neutral)
+        n = len(sentences)
+        scores = np.full(n, 0.5, dtype=np.float32)
+        m = min(len(cnn_probs), n)
+        scores[:m] = np.asarray(cnn_probs[:m], dtype=np.float32)
         
         # Normalize to sum to 1
         if scores.sum() > 0:
             scores = scores / scores.sum()
         else:
-            scores = np.ones(len(sentences)) / len(sentences)
+            scores = np.ones(len(sentences), dtype=np.float32) / len(sentences)
         
         return scores
     
+    def _weight_cache_key(self, sentences: List[str], cnn_probs: Optional[List[float]]) -> tuple:
+        """
+        Key for the weight cache.
+        
+        Covers the inputs and every setting that changes the result, so that
+        reassigning a component weight or an embedding model failing to load
+        does not return stale weights.
+        """
+        use_embeddings = self.tfidf_weight > 0 and self.use_embeddings and self.embedding_model is not None
+        return (
+            tuple(sentences),
+            tuple(cnn_probs) if cnn_probs is not None else None,
+            self.cnn_prob_weight,
+            self.textrank_weight,
+            self.tfidf_weight,
+            self.position_weight,
+            use_embeddings,
+            self._emb_model_name if use_embeddings else None
+        )
+    
+    def _is_weight_cached(self, cache_key: tuple) -> bool:
+        """Check whether weights for cache_key are cached."""
+        with self._weight_cache_lock:
+            return cache_key in self._weight_cache
+    
+    def _get_cached_weights(self, cache_key: tuple) -> Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+        """Return a copy of the cached weights for cache_key, or None."""
+        with self._weight_cache_lock:
+            cached = self._weight_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._weight_cache.move_to_end(cache_key)
+        combined_scores, component_scores = cached
+        return combined_scores.copy(), {name: arr.copy() for name, arr in component_scores.items()}
+    
+    def _store_cached_weights(
+        self,
+        cache_key: tuple,
+        combined_scores: np.ndarray,
+        component_scores: Dict[str, np.ndarray]
+    ) -> None:
+        """Store private copies of computed weights, evicting the least recently used entry."""
+        entry = (combined_scores.copy(), {name: arr.copy() for name, arr in component_scores.items()})
+        with self._weight_cache_lock:
+            self._weight_cache[cache_key] = entry
+            self._weight_cache.move_to_end(cache_key)
+            while len(self._weight_cache) > self._weight_cache_size:
+                self._weight_cache.popitem(last=False)
+    
     def compute_sentence_weights(
         self,
         sentences: List[str],
         original_text: str = "",
-        cnn_probs: Optional[List[float]] = None
+        cnn_probs: Optional[List[float]] = None,
+        embeddings: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
         """
         Compute combined sentence weights using all available components.
@@ -318,62 +669,70 @@ class SentenceSummarizer:
             sentences: List of segmented sentences
             original_text: Original full text (for context)
             cnn_probs: Optional list of CNN probabilities for sentence boundaries
+            embeddings: Optional precomputed sentence embeddings (used when use_embeddings is set)
         
         Returns:
             Tuple of (combined_weights, component_scores_dict)
             - combined_weights: Normalized weights summing to 1
             - component_scores_dict: Dictionary with individual component scores
+            Results are cached; callers always receive their own copies.
         """
         if len(sentences) == 0:
-            return np.array([]), {}
-        
+            return np.array([], dtype=np.float32), {}
+        
+        cache_key = self._weight_cache_key(sentences, cnn_probs)
+        cached = self._get_cached_weights(cache_key)
+        if cached is not None:
+            return cached
+        
+        # One row per component: cnn_prob, textrank, tfidf/embeddings, position
+        scores = np.zeros((4, len(sentences)), dtype=np.float32)
+        weights = np.array(
+            [self.cnn_prob_weight, self.textrank_weight, self.tfidf_weight, self.position_weight],
+            dtype=np.float32
+        )
         component_scores = {}
         
         # Compute CNN probability scores
         if self.cnn_prob_weight > 0:
-            cnn_scores = self._compute_cnn_prob_scores(sentences, original_text, cnn_probs)
-            component_scores['cnn_prob'] = cnn_scores
-        else:
-            cnn_scores = np.zeros(len(sentences))
+            scores[0] = self._compute_cnn_prob_scores(sentences, original_text, cnn_probs)
+            component_scores['cnn_prob'] = scores[0]
         
         # Compute TextRank scores
         if self.textrank_weight > 0:
-            textrank_scores = self._compute_textrank_scores(sentences)
-            component_scores['textrank'] = textrank_scores
-        else:
-            textrank_scores = np.zeros(len(sentences))
+            scores[1] = self._compute_textrank_scores(sentences)
+            component_scores['textrank'] = scores[1]
         
         # Compute TF-IDF or embedding scores
         if self.tfidf_weight > 0:
-            if self.use_embeddings:
-                similarity_scores = self._compute_embedding_scores(sentences)
-                component_scores['embeddings'] = similarity_scores
+            if self.use_embeddings and self.embedding_model is not None:
+                scores[2] = self._compute_embedding_scores(sentences, embeddings)
+                component_scores['embeddings'] = scores[2]
             else:
-                similarity_scores = self._compute_tfidf_scores(sentences)
-                component_scores['tfidf'] = similarity_scores
-        else:
-            similarity_scores = np.zeros(len(sentences))
+                scores[2] = self._compute_tfidf_scores(sentences)
+                component_scores['tfidf'] = scores[2]
         
         # Compute position scores
         if self.position_weight > 0:
-            position_scores = self._compute_position_scores(sentences)
-            component_scores['position'] = position_scores
-        else:
-            position_scores = np.zeros(len(sentences))
-        
-        # Combine scores with weights
-        combined_scores = (
-            self.cnn_prob_weight * cnn_scores +                    # make cnn probability score 0
-            self.textrank_weight * textrank_scores +
-            self.tfidf_weight * similarity_scores +
-            self.position_weight * position_scores
-        )
+            scores[3] = self._compute_position_scores(sentences)
+            component_scores['position'] = scores[3]
         
-        # Normalize to sum to 1
-        if combined_scores.sum() > 0:
-            combined_scores = combined_scores / combined_scores.sum()
+        active = np.flatnonzero(weights > 0)
+        if len(active) == 1:
+            # A single active component is already normalized
+            combined_scores = scores[active[0]].copy()
         else:
-            combined_scores = np.ones(len(sentences)) / len(sentences)
+            # Combine scores with weights
+            combined_scores = weights @ scores
+            
+            # Normalize to sum to 1
+            total = combined_scores.sum()
+            if total > 0:
+                combined_scores /= total
+            else:
+                combined_scores = np.ones(len(sentences), dtype=np.float32) / len(sentences)
+        
+        self._store_cached_weights(cache_key, combined_scores, component_scores)
         
         return combined_scores, component_scores
     
@@ -384,7 +743,8 @@ class SentenceSummarizer:
         cnn_probs: Optional[List[float]] = None,
         compression: Optional[float] = None,
         top_k: Optional[int] = None,
-        preserve_order: bool = True
+        preserve_order: bool = True,
+        embeddings: Optional[np.ndarray] = None
     ) -> Tuple[List[str], np.ndarray, Dict[str, np.ndarray]]:
         """
         Generate extractive summary by selecting top sentences.
@@ -395,17 +755,19 @@ class SentenceSummarizer:
             cnn_probs: Optional list of CNN probabilities
             compression: Compression ratio (0-1), e.g., 0.2 means 20% of sentences
             top_k: Number of top sentences to select (alternative to compression)
-            preserve_order: If True, maintain original sentence order in summary
+            preserve_order: If True, maintain original sentence order in summary;
+                otherwise return sentences by descending weight
+            embeddings: Optional precomputed sentence embeddings
         
         Returns:
             Tuple of (selected_sentences, weights, component_scores_dict)
         """
         if len(sentences) == 0:
-            return [], np.array([]), {}
+            return [], np.array([], dtype=np.float32), {}
         
         # Compute weights
         weights, component_scores = self.compute_sentence_weights(
-            sentences, original_text, cnn_probs
+            sentences, original_text, cnn_probs, embeddings
         )
         
         # Determine number of sentences to select
@@ -417,20 +779,80 @@ class SentenceSummarizer:
             # Default: select top 30% or at least 2 sentences
             n_select = max(2, int(len(sentences) * 0.3))
         
-        # Select top sentences
-        if preserve_order:
-            # Sort by weight but maintain original order in output
-            sentence_indices = list(range(len(sentences)))
-            sentence_indices.sort(key=lambda i: weights[i], reverse=True)
-            selected_indices = sorted(sentence_indices[:n_select])  # Sort to preserve order
+        # Select top sentences (partial selection, O(N)); ties at the cut-off
+        # go to the earliest sentences
+        n_select = max(0, min(n_select, len(sentences)))
+        if 0 < n_select < len(sentences):
+            kth_weight = np.partition(weights, -n_select)[-n_select]
+            above = np.flatnonzero(weights > kth_weight)
+            ties = np.flatnonzero(weights == kth_weight)[:n_select - above.size]
+            top = np.sort(np.concatenate([above, ties]))
         else:
-            # Select top-k by weight
-            selected_indices = np.argsort(weights)[::-1][:n_select]
-            selected_indices = sorted(selected_indices)  # Sort to preserve order
+            top = np.arange(n_select)
+        selected_indices = top if preserve_order else top[np.argsort(-weights[top], kind='stable')]
         
         selected_sentences = [sentences[i] for i in selected_indices]
-        selected_weights = weights[selected_indices]
         
         return selected_sentences, weights, component_scores
-
-
+    
+    def summarize_batch(
+        self,
+        docs: List[List[str]],
+        original_texts: Optional[List[str]] = None,
+        cnn_probs: Optional[List[Optional[List[float]]]] = None,
+        **kwargs
+    ) -> List[Tuple[List[str], np.ndarray, Dict[str, np.ndarray]]]:
+        """
+        Summarize several documents, encoding all their sentences in one batch.
+        
+        TextRank, TF-IDF and position scores remain per document; only the
+        sentence-transformers forward pass is shared.
+        
+        Args:
+            docs: List of documents, each a list of segmented sentences
+            original_texts: Optional original full text per document
+            cnn_probs: Optional CNN probabilities per document (entries may be None)
+            **kwargs: Options passed to summarize for every document
+                (compression, top_k, preserve_order)
+        
+        Returns:
+            List of (selected_sentences, weights, component_scores_dict), one per document
+        """
+        if 'embeddings' in kwargs:
+            raise TypeError("summarize_batch() computes embeddings itself and does not accept 'embeddings'")
+        if 'original_text' in kwargs:
+            raise TypeError("summarize_batch() takes per-document texts as 'original_texts', not 'original_text'")
+        if original_texts is None:
+            original_texts = [""] * len(docs)
+        if cnn_probs is None:
+            cnn_probs = [None] * len(docs)
+        if len(original_texts) != len(docs) or len(cnn_probs) != len(docs):
+            raise ValueError("original_texts and cnn_probs must have one entry per document")
+        
+        doc_embeddings: List[Optional[np.ndarray]] = [None] * len(docs)
+        
+        if self.tfidf_weight > 0 and self.use_embeddings and self.embedding_model is not None:
+            # Skip documents whose weights are already cached
+            pending = [
+                i for i, doc in enumerate(docs)
+                if doc and not self._is_weight_cached(self._weight_cache_key(doc, cnn_probs[i]))
+            ]
+            if pending:
+                try:
+                    all_embeddings = self._encode([s for i in pending for s in docs[i]])
+                    offsets = np.cumsum([0] + [len(docs[i]) for i in pending])
+                    for i, start, end in zip(pending, offsets[:-1], offsets[1:]):
+                        doc_embeddings[i] = all_embeddings[start:end]
+                except Exception as e:
+                    warnings.warn(f"Batch embedding failed: {e}. Encoding documents individually.")
+        
+        return [
+            self.summarize(
+                doc,
+                original_text=original_texts[i],
+                cnn_probs=cnn_probs[i],
+                embeddings=doc_embeddings[i],
+                **kwargs
+            )
+            for i, doc in enumerate(docs)
+        ]